@@ -5,17 +5,149 @@ Step 1: Export font to .babelfont JSON
 Usage:
     python 1-export-to-json.py input.glyphs output.babelfont
     python 1-export-to-json.py input.ufo output.babelfont
+
+The export is skipped if the input has not changed since the last export
+to the same output; pass --force to export anyway.
 """
 
+import os
+import queue
 import sys
+import threading
 import time
 import orjson
-from pathlib import Path
 
+# Number of glyphs encoded per chunk when streaming the JSON
+GLYPHS_PER_CHUNK = 256
+
+# Serialize any numpy arrays found in the font data natively
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# Encoded chunks that may wait for the writer thread before encoding blocks
+WRITE_QUEUE_SIZE = 8
+
+
+def iter_json_chunks(font_dict):
+    """Yield the JSON encoding of a font dict piece by piece
+
+    The glyphs list is encoded a slice at a time, so the complete JSON
+    document never exists in memory as a single bytes object. Joining
+    the chunks gives the same bytes as
+    orjson.dumps(font_dict, option=orjson.OPT_APPEND_NEWLINE).
+    """
+    yield b"{"
+    for index, (key, value) in enumerate(font_dict.items()):
+        yield (b"," if index else b"") + orjson.dumps(key) + b":"
+        if key != "glyphs":
+            yield orjson.dumps(value, option=JSON_OPTIONS)
+            continue
+
+        yield b"["
+        for start in range(0, len(value), GLYPHS_PER_CHUNK):
+            chunk = orjson.dumps(
+                value[start : start + GLYPHS_PER_CHUNK], option=JSON_OPTIONS
+            )
+            # Strip the slice's own brackets so the pieces form one array
+            yield (b"," if start else b"") + chunk[1:-1]
+        yield b"]"
+    yield b"}\n"
+
+
+def write_chunks(chunks, f):
+    """Write chunks to f on a background thread
+
+    The disk writes (which release the GIL) overlap with encoding the
+    next chunks on the calling thread. Chunks are written in order, and
+    any write error is re-raised here.
+    """
+    pending = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+    errors = []
+
+    def writer():
+        while (chunk := pending.get()) is not None:
+            # Keep draining after an error so the producer never blocks
+            if not errors:
+                try:
+                    f.write(chunk)
+                except Exception as e:
+                    errors.append(e)
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+    finally:
+        pending.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def font_display_name(font):
+    """Default family name of a font, falling back to its file name"""
+    family_name = getattr(getattr(font, "names", None), "familyName", None)
+    if isinstance(family_name, dict) and "dflt" in family_name:
+        return family_name["dflt"]
+
+    family_name = getattr(getattr(font, "info", None), "familyName", None)
+    if family_name:
+        return family_name
+
+    filename = getattr(font, "filename", None)
+    if filename:
+        return filename.split("/")[-1]
+
+    return "Untitled"
+
+
+def source_mtime_ns(path):
+    """Latest modification time of a font file or font package directory"""
+    latest = os.stat(path).st_mtime_ns
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            for name in dirs + files:
+                try:
+                    mtime = os.stat(os.path.join(root, name)).st_mtime_ns
+                except FileNotFoundError:
+                    # Removed while walking the package
+                    continue
+                latest = max(latest, mtime)
+    return latest
+
+
+def read_export_meta(meta_path):
+    """Read the sidecar written by the last export, or None"""
+    try:
+        with open(meta_path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
 
-def export_to_json(input_file, output_json):
+
+def export_to_json(input_file, output_json, force=False):
     """Export a font to .babelfont JSON format"""
 
+    # Skip the export if the output is newer than any change to the input
+    meta_path = output_json + ".meta"
+    try:
+        meta = {
+            "input": os.path.abspath(input_file),
+            "mtime_ns": source_mtime_ns(input_file),
+        }
+    except OSError:
+        # Let the font loader below report the missing or unreadable input
+        meta = None
+    if meta is not None and not force and os.path.exists(output_json):
+        if read_export_meta(meta_path) == meta:
+            json_size_kb = os.path.getsize(output_json) / 1024
+            print(f"✅ {output_json} is up to date, skipping export")
+            print(f"📊 JSON size: {json_size_kb:.2f} KB")
+            return True
+
     print("📖 Loading font...")
     start_time = time.time()
 
@@ -36,25 +168,27 @@ def export_to_json(input_file, output_json):
         print(f"❌ Failed to load font: {e}")
         sys.exit(1)
 
-    # Get font info
-    font_name = "Untitled"
-    if hasattr(font, "names") and hasattr(font.names, "familyName"):
-        familyName = font.names.familyName
-        if isinstance(familyName, dict) and "dflt" in familyName:
-            font_name = familyName["dflt"]
-
-    print(f"📝 Font name: {font_name}")
+    print(f"📝 Font name: {font_display_name(font)}")
 
-    # Export to .babelfont JSON
-    print("🔄 Exporting to .babelfont JSON...")
+    # Export to .babelfont JSON, writing straight to disk
+    print(f"🔄 Exporting to {output_json}...")
     export_start = time.time()
 
     try:
+        # A half-written output must never look up to date
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
         font_dict = font.to_dict()
-        babelfont_json = orjson.dumps(font_dict)
+        with open(output_json, "wb", buffering=1 << 20) as f:
+            write_chunks(iter_json_chunks(font_dict), f)
         export_time = time.time() - export_start
 
-        json_size_kb = len(babelfont_json) / 1024
+        if meta is not None:
+            with open(meta_path, "wb") as f:
+                f.write(orjson.dumps(meta))
+
+        json_size_kb = os.path.getsize(output_json) / 1024
         print(f"✅ Exported in {export_time:.3f}s")
         print(f"📊 JSON size: {json_size_kb:.2f} KB")
 
@@ -65,20 +199,16 @@ def export_to_json(input_file, output_json):
         traceback.print_exc()
         sys.exit(1)
 
-    # Save the JSON
-    print(f"💾 Saving to {output_json}...")
-    Path(output_json).write_bytes(babelfont_json)
-    print("✅ JSON saved")
-
     return True
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python 1-export-to-json.py input.font output.babelfont")
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    if len(args) < 2:
+        print("Usage: python 1-export-to-json.py [--force] input.font output.babelfont")
         sys.exit(1)
 
-    input_file = sys.argv[1]
-    output_json = sys.argv[2]
+    input_file = args[0]
+    output_json = args[1]
 
-    export_to_json(input_file, output_json)
+    export_to_json(input_file, output_json, force="--force" in sys.argv)
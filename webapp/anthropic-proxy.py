@@ -4,10 +4,62 @@ Simple CORS proxy for Anthropic API
 Run this alongside your main server: python3 anthropic-proxy.py
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import json
-import urllib.request
-import urllib.error
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import http.client
+import queue
+import select
+import shutil
+import ssl
+
+API_HOST = "api.anthropic.com"
+API_PATH = "/v1/messages"
+CHUNK_SIZE = 64 * 1024
+# Largest request body the proxy will forward
+MAX_BODY_SIZE = 32 * 1024 * 1024
+
+# Idle keep-alive connections to the API, shared by all handler threads
+_ssl_context = ssl.create_default_context()
+_idle_connections = queue.SimpleQueue()
+
+
+def _get_connection():
+    """Return an idle API connection, or open a new one"""
+    while True:
+        try:
+            conn = _idle_connections.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPSConnection(API_HOST, context=_ssl_context)
+        # An idle socket that is readable has been closed by the server
+        if conn.sock is not None and not select.select([conn.sock], [], [], 0)[0]:
+            return conn
+        conn.close()
+
+
+def _release_connection(conn, response):
+    """Hand a connection back to the pool once its response is consumed"""
+    if response.will_close:
+        conn.close()
+    else:
+        _idle_connections.put(conn)
+
+
+class _ClientDisconnected(ConnectionError):
+    """The client closed its connection before sending the whole body"""
+
+
+def _iter_body(stream, length, chunk_size=CHUNK_SIZE):
+    """Yield exactly ``length`` bytes from ``stream`` in fixed-size chunks"""
+    remaining = length
+    while remaining > 0:
+        chunk = stream.read(min(chunk_size, remaining))
+        if not chunk:
+            # Sending less than the declared Content-Length would leave
+            # the upstream server waiting for the rest of the body
+            raise _ClientDisconnected(
+                f"Client sent {length - remaining} of {length} body bytes"
+            )
+        remaining -= len(chunk)
+        yield chunk
 
 
 class ProxyHandler(BaseHTTPRequestHandler):
@@ -23,10 +75,19 @@ class ProxyHandler(BaseHTTPRequestHandler):
 
     def do_POST(self):
         """Proxy POST requests to Anthropic API"""
+        # Set once the upstream status line has gone out to the client
+        self._response_started = False
         try:
-            # Read request body
-            content_length = int(self.headers["Content-Length"])
-            body = self.rfile.read(content_length)
+            try:
+                content_length = int(self.headers.get("Content-Length", "0"))
+            except ValueError:
+                content_length = -1
+            if content_length < 0:
+                self.send_error(400, "Invalid Content-Length")
+                return
+            if content_length > MAX_BODY_SIZE:
+                self.send_error(413, "Request body too large")
+                return
 
             # Get API key from headers
             api_key = self.headers.get("x-api-key")
@@ -36,44 +97,58 @@ class ProxyHandler(BaseHTTPRequestHandler):
                 self.send_error(401, "API key required")
                 return
 
-            # Forward request to Anthropic
-            req = urllib.request.Request(
-                "https://api.anthropic.com/v1/messages",
-                data=body,
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": api_key,
-                    "anthropic-version": anthropic_version,
-                },
-                method="POST",
-            )
+            # Forward request to Anthropic over a pooled connection,
+            # streaming the body through
+            conn = _get_connection()
+            try:
+                conn.request(
+                    "POST",
+                    API_PATH,
+                    body=_iter_body(self.rfile, content_length),
+                    headers={
+                        "Content-Type": "application/json",
+                        "Content-Length": str(content_length),
+                        "x-api-key": api_key,
+                        "anthropic-version": anthropic_version,
+                    },
+                )
+                response = conn.getresponse()
 
-            # Get response from Anthropic
-            with urllib.request.urlopen(req) as response:
-                response_data = response.read()
-
-                # Send response back to client
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.send_header("Access-Control-Allow-Origin", "*")
-                self.end_headers()
-                self.wfile.write(response_data)
-
-        except urllib.error.HTTPError as e:
-            error_body = e.read()
-            self.send_response(e.code)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
-            self.wfile.write(error_body)
+                # Stream response from Anthropic back to client
+                self._relay(response.status, response)
+            except BaseException:
+                conn.close()
+                raise
+            _release_connection(conn, response)
+
+        except _ClientDisconnected:
+            # Nobody is left to send an error response to
+            self.close_connection = True
 
         except Exception as e:
-            self.send_error(500, str(e))
+            if self._response_started:
+                # Too late for an error response; the client is already
+                # receiving the upstream body, so cut it off instead
+                self.close_connection = True
+            else:
+                self.send_error(500, str(e))
+
+    def _relay(self, status, response):
+        """Send an upstream response to the client without buffering it"""
+        self._response_started = True
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        length = response.headers.get("Content-Length")
+        if length is not None:
+            self.send_header("Content-Length", length)
+        self.end_headers()
+        shutil.copyfileobj(response, self.wfile, CHUNK_SIZE)
 
 
 if __name__ == "__main__":
     PORT = 8001
-    server = HTTPServer(("localhost", PORT), ProxyHandler)
+    server = ThreadingHTTPServer(("localhost", PORT), ProxyHandler)
     print(f"🚀 Anthropic API proxy running on http://localhost:{PORT}")
     print(f"   Use this URL in your app: http://localhost:{PORT}")
     server.serve_forever()
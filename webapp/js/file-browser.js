@@ -63,16 +63,13 @@ import time
 import json
 start_time = time.time()
 font = OpenFont('${path}')
-# Try to get font name from font.names.familyName['dflt']
-font_name = 'Untitled'
-if hasattr(font, 'names') and hasattr(font.names, 'familyName') and isinstance(font.names.familyName, dict) and 'dflt' in font.names.familyName:
-    font_name = font.names.familyName['dflt']
+# Get the current font ID for tracking init
+font_id = GetCurrentFontId()
+# Use the display name cached by the font registry (as in the dropdown)
+font_name = next(f["name"] for f in GetOpenFonts() if f["id"] == font_id)
 duration = time.time() - start_time
 print(f"✅ Font loaded: {font_name} ({duration:.2f}s)")
 print("⏳ Initializing dirty tracking...")
-
-# Get the current font ID for tracking init
-font_id = GetCurrentFontId()
 json.dumps({"font_name": font_name, "font_id": font_id, "load_time": duration})
         `);
 
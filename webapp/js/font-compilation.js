@@ -176,7 +176,7 @@ class FontCompilation {
         try {
             // Call Python to export JSON (in memory, no file writes!)
             const babelfontJson = await window.pyodide.runPythonAsync(`
-import json
+import orjson
 
 # Get the font object
 try:
@@ -184,9 +184,9 @@ try:
 except NameError:
     raise ValueError("Font variable '${fontVariableName}' not found. Make sure it's defined.")
 
-# Export to .babelfont JSON (in memory)
+# Export to .babelfont JSON (in memory) using orjson (handles datetime objects)
 font_dict = font_obj.to_dict()
-json.dumps(font_dict)
+orjson.dumps(font_dict).decode('utf-8')
             `);
 
             console.log(`✅ Exported to JSON (${babelfontJson.length} bytes)`);
@@ -246,15 +246,15 @@ json.dumps(font_dict)
             console.log(`📖 Loading ${inputPath}...`);
 
             const babelfontJson = await window.pyodide.runPythonAsync(`
-import json
+import orjson
 from contextfonteditor import Font
 
 # Load font from file
 font = Font('${inputPath}')
 
-# Export to .babelfont JSON
+# Export to .babelfont JSON using orjson (handles datetime objects)
 font_dict = font.to_dict()
-json.dumps(font_dict)
+orjson.dumps(font_dict).decode('utf-8')
             `);
 
             console.log(`✅ Loaded and exported to JSON`);
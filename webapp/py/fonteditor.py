@@ -4,19 +4,106 @@ Core functionality for font editing operations
 """
 
 from context import load
-import uuid
+from secrets import token_hex
+import os as _os
+import time as _time
 
+try:
+    import js as _js  # Only available when running under Pyodide
+except ImportError:
+    _js = None
 
-__open_fonts = {}  # Dictionary of {font_id: font_object}
+
+class _FontEntry:
+    """Registry record for an open font."""
+
+    __slots__ = ("font", "name", "path", "mtime", "tracking_ready")
+
+    def __init__(self, font, mtime):
+        self.font = font
+        # Files on disk newer than this mean the font changed since loading
+        self.mtime = mtime
+        self.tracking_ready = False
+        self.update_meta()
+
+    def update_meta(self):
+        """
+        Derive the display name and path shown for the font in the UI.
+
+        This is evaluated once when a font is opened (and again after it is
+        saved) so that GetOpenFonts() does not have to probe the font object
+        on every font list refresh.
+        """
+        font = self.font
+        self.name = _font_display_name(font)
+        self.path = getattr(font, "filename", "") or ""
+
+
+def _font_display_name(font):
+    """
+    Return the name shown for a font in the UI: its default family name,
+    falling back to font.info.familyName and then to the file name.
+    """
+    # Try font.names.familyName['dflt'] first (context)
+    family_name = getattr(getattr(font, "names", None), "familyName", None)
+    if isinstance(family_name, dict) and "dflt" in family_name:
+        return family_name["dflt"]
+
+    # Fallback to font.info.familyName
+    family_name = getattr(getattr(font, "info", None), "familyName", None)
+    if family_name:
+        return family_name
+
+    # Fallback to filename
+    filename = getattr(font, "filename", None)
+    if filename:
+        return filename.split("/")[-1]
+
+    return "Untitled Font"
+
+
+def _source_mtime_ns(path):
+    """
+    Return the latest modification time of a font file or font package
+    directory (.babelfont, .ufo, .glyphspackage), or None if it is missing.
+    """
+    try:
+        latest = _os.stat(path).st_mtime_ns
+        if _os.path.isdir(path):
+            for root, dirs, files in _os.walk(path):
+                for name in dirs + files:
+                    try:
+                        mtime = _os.stat(_os.path.join(root, name)).st_mtime_ns
+                    except FileNotFoundError:
+                        # Removed while walking the package
+                        continue
+                    latest = max(latest, mtime)
+    except OSError:
+        return None
+    return latest
+
+
+__open_fonts = {}  # Dictionary of {font_id: _FontEntry}
 __current_font_id = None  # ID of the currently active font
-# Track if dirty tracking has been initialized for each font
-__tracking_initialized = {}
+
+
+def _font_entry(font_id=None):
+    """
+    Return the registry entry for a font ID (the current font if None),
+    or None if no such font is open.
+    """
+    return __open_fonts.get(__current_font_id if font_id is None else font_id)
 
 
 def OpenFont(path):
     """
     Open a font file and return a Font object.
 
+    Opening a .babelfont that is already open, has no unsaved changes and
+    has not changed on disk since returns the already open Font object
+    (made current again) instead of loading a second copy, so repeated
+    calls alias the same font. Other formats are always loaded afresh.
+
     Note: Dirty tracking is initialized separately after loading via
     InitializeTracking() to keep the UI responsive. Use IsTrackingReady()
     to check if tracking is initialized.
@@ -33,6 +120,19 @@ def OpenFont(path):
     """
     global __current_font_id
 
+    # Reuse the already open font if neither it nor its files changed
+    mtime = _source_mtime_ns(path)
+    if mtime is not None and path.endswith(".babelfont"):
+        for font_id, entry in __open_fonts.items():
+            if (
+                entry.path == path
+                and entry.mtime is not None
+                and mtime <= entry.mtime
+                and not entry.font.is_dirty()
+            ):
+                __current_font_id = font_id
+                return entry.font
+
     __font_to_load = load(path)
 
     # Ensure the filename is set (should be done by loader, but make sure)
@@ -40,11 +140,10 @@ def OpenFont(path):
         __font_to_load.filename = path
 
     # Generate a unique ID for this font
-    font_id = str(uuid.uuid4())
+    font_id = token_hex(16)
 
     # Store the font with its ID
-    __open_fonts[font_id] = __font_to_load
-    __tracking_initialized[font_id] = False
+    __open_fonts[font_id] = _FontEntry(__font_to_load, mtime)
 
     # Set as current font
     __current_font_id = font_id
@@ -71,10 +170,9 @@ def _register_ui_callbacks(font, font_id):
         """Called before saving begins."""
         # Call JavaScript callback if available
         try:
-            import js
-
-            if hasattr(js, "_fontSaveCallbacks"):
-                js._fontSaveCallbacks.beforeSave(font_id, filename)
+            callbacks = getattr(_js, "_fontSaveCallbacks", None)
+            if callbacks is not None:
+                callbacks.beforeSave(font_id, filename)
         except Exception as e:
             print(f"Error in before_save callback: {e}")
 
@@ -85,12 +183,19 @@ def _register_ui_callbacks(font, font_id):
 
         print(f"Saved font to {filename} in {duration:.2f}s")
 
+        # The filename (Save As) or family name may have changed
+        entry = _font_entry(font_id)
+        if entry is not None:
+            entry.update_meta()
+            # Every file just written is older than now; avoids re-walking
+            # the whole package after a save that touched a few glyphs
+            entry.mtime = _time.time_ns()
+
         # Call JavaScript callback if available
         try:
-            import js
-
-            if hasattr(js, "_fontSaveCallbacks"):
-                js._fontSaveCallbacks.afterSave(font_id, filename, duration)
+            callbacks = getattr(_js, "_fontSaveCallbacks", None)
+            if callbacks is not None:
+                callbacks.afterSave(font_id, filename, duration)
         except Exception as e:
             print(f"Error in after_save callback: {e}")
 
@@ -100,10 +205,9 @@ def _register_ui_callbacks(font, font_id):
 
         # Call JavaScript callback if available
         try:
-            import js
-
-            if hasattr(js, "_fontSaveCallbacks"):
-                js._fontSaveCallbacks.onError(font_id, filename, str(error))
+            callbacks = getattr(_js, "_fontSaveCallbacks", None)
+            if callbacks is not None:
+                callbacks.onError(font_id, filename, str(error))
         except Exception as e:
             print(f"Error in on_error callback: {e}")
 
@@ -140,9 +244,8 @@ def CurrentFont():
         >>> font = CurrentFont()
         >>> print(font.info.familyName)
     """
-    if __current_font_id and __current_font_id in __open_fonts:
-        return __open_fonts[__current_font_id]
-    return None
+    entry = _font_entry()
+    return entry.font if entry is not None else None
 
 
 def SetCurrentFont(font_id):
@@ -173,29 +276,24 @@ def InitializeTracking(font_id=None):
     Returns:
         dict: Result with 'success', 'duration'
     """
-    if font_id is None:
-        font_id = __current_font_id
-
-    if font_id is None or font_id not in __open_fonts:
+    entry = _font_entry(font_id)
+    if entry is None:
         return {"error": "Font not found", "success": False}
 
-    if __tracking_initialized.get(font_id, False):
+    if entry.tracking_ready:
         return {
             "success": True,
             "already_initialized": True,
             "duration": 0,
         }
 
-    import time
-
-    start_time = time.time()
-    font = __open_fonts[font_id]
+    start_time = _time.perf_counter()
 
     # Initialize tracking (runs synchronously, optimized with lazy loading)
-    font.initialize_dirty_tracking()
+    entry.font.initialize_dirty_tracking()
 
-    total_duration = time.time() - start_time
-    __tracking_initialized[font_id] = True
+    total_duration = _time.perf_counter() - start_time
+    entry.tracking_ready = True
 
     print(f"✅ Dirty tracking initialized in {total_duration:.2f}s")
 
@@ -215,13 +313,8 @@ def IsTrackingReady(font_id=None):
     Returns:
         bool: True if tracking is initialized, False otherwise
     """
-    if font_id is None:
-        font_id = __current_font_id
-
-    if font_id is None or font_id not in __tracking_initialized:
-        return False
-
-    return __tracking_initialized[font_id]
+    entry = _font_entry(font_id)
+    return entry is not None and entry.tracking_ready
 
 
 def WaitForTracking(font_id=None):
@@ -236,9 +329,6 @@ def WaitForTracking(font_id=None):
     Returns:
         bool: True when tracking is ready
     """
-    if font_id is None:
-        font_id = __current_font_id
-
     # Since we're initializing synchronously, this just returns the status
     return IsTrackingReady(font_id)
 
@@ -291,40 +381,12 @@ def GetOpenFonts():
         >>> for font_info in fonts:
         ...     print(font_info['id'], font_info['name'])
     """
-    result = []
-    for font_id, font in __open_fonts.items():
-        # Try to get a display name for the font
-        name = "Untitled Font"
-
-        # Try font.names.familyName['dflt'] first (context)
-        if (
-            hasattr(font, "names")
-            and hasattr(font.names, "familyName")
-            and isinstance(font.names.familyName, dict)
-            and "dflt" in font.names.familyName
-        ):
-            name = font.names.familyName["dflt"]
-        # Fallback to font.info.familyName
-        elif (
-            hasattr(font, "info")
-            and hasattr(font.info, "familyName")
-            and font.info.familyName
-        ):
-            name = font.info.familyName
-        # Fallback to filename
-        elif hasattr(font, "filename") and font.filename:
-            name = font.filename.split("/")[-1]
-
-        # Try to get the path
-        path = getattr(font, "filename", "") or ""
-
-        result.append(
-            {
-                "id": font_id,
-                "name": name,
-                "path": path,
-                "is_current": font_id == __current_font_id,
-            }
-        )
-
-    return result
+    return [
+        {
+            "id": font_id,
+            "name": entry.name,
+            "path": entry.path,
+            "is_current": font_id == __current_font_id,
+        }
+        for font_id, entry in __open_fonts.items()
+    ]
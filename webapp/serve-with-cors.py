@@ -4,33 +4,86 @@ HTTP server with CORS headers required for SharedArrayBuffer (WASM threading)
 Based on Simon Cozens' approach in fontc-web
 """
 
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import os
+import signal
 import sys
 
+# These headers are required for SharedArrayBuffer to work
+# which is needed for WASM threading with wasm-bindgen-rayon.
+# They are the same for every response, so encode them only once.
+_FIXED_CORS_HEADERS = (
+    b"Cross-Origin-Embedder-Policy: require-corp\r\n"
+    b"Cross-Origin-Opener-Policy: same-origin\r\n"
+    # Also allow WASM MIME type
+    b"Cross-Origin-Resource-Policy: cross-origin\r\n"
+)
+
 
 class CORSRequestHandler(SimpleHTTPRequestHandler):
+    # Keep connections open between requests, so one handler instance (and
+    # its socket, buffers and thread) serves all the assets the browser
+    # pulls over that connection. Every response sets Content-Length.
+    protocol_version = "HTTP/1.1"
+
     def end_headers(self):
-        # These headers are required for SharedArrayBuffer to work
-        # which is needed for WASM threading with wasm-bindgen-rayon
-        self.send_header("Cross-Origin-Embedder-Policy", "require-corp")
-        self.send_header("Cross-Origin-Opener-Policy", "same-origin")
-        # Also allow WASM MIME type
-        self.send_header("Cross-Origin-Resource-Policy", "cross-origin")
+        # HTTP/0.9 responses carry no headers at all
+        if self.request_version != "HTTP/0.9":
+            self._headers_buffer.append(_FIXED_CORS_HEADERS)
         SimpleHTTPRequestHandler.end_headers(self)
 
-    def guess_type(self, path):
-        mime_type = SimpleHTTPRequestHandler.guess_type(self, path)
+    def copyfile(self, source, outputfile):
+        # Let the kernel send file bodies (notably the multi-MB WASM
+        # modules) straight to the socket. socket.sendfile() falls back
+        # to plain send() calls for sources without a file descriptor,
+        # such as directory listings.
+        if outputfile is self.wfile:
+            self.connection.sendfile(source)
+        else:
+            SimpleHTTPRequestHandler.copyfile(self, source, outputfile)
+
+    # MIME types for the files the webapp serves. guess_type() checks this
+    # map before falling back to the (slower) mimetypes module.
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
         # Ensure .wasm files get the correct MIME type
-        if path.endswith(".wasm"):
-            return "application/wasm"
-        return mime_type
+        ".wasm": "application/wasm",
+        ".js": "application/javascript",
+        ".mjs": "application/javascript",
+        ".wat": "text/plain",
+        ".json": "application/json",
+        ".html": "text/html; charset=utf-8",
+        ".css": "text/css",
+        ".py": "text/x-python",
+        ".woff2": "font/woff2",
+        ".ttf": "font/ttf",
+        ".otf": "font/otf",
+    }
+
+
+def _serve_worker(httpd):
+    """Serve requests in a forked worker process until interrupted"""
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    os._exit(0)
 
 
-def run(port=8000):
+def run(port=8000, workers=None):
     server_address = ("", port)
-    httpd = HTTPServer(server_address, CORSRequestHandler)
+    httpd = ThreadingHTTPServer(server_address, CORSRequestHandler)
+
+    # Worker processes share the listening socket, and the kernel hands
+    # each new connection to one of them
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not hasattr(os, "fork"):
+        workers = 1
+
     print(f"🚀 Starting server with CORS headers on port {port}")
     print(f"📡 Server URL: http://localhost:{port}")
+    print(f"👷 Worker processes: {workers}")
     print(f"")
     print(f"✅ CORS headers enabled for WASM threading:")
     print(f"   - Cross-Origin-Embedder-Policy: require-corp")
@@ -38,16 +91,37 @@ def run(port=8000):
     print(f"")
     print(f"Press Ctrl+C to stop the server")
     print(f"")
+    sys.stdout.flush()
+
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            _serve_worker(httpd)
+        children.append(pid)
+
+    # Stop the workers too when the main process is terminated
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
 
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print(f"\n👋 Server stopped")
         sys.exit(0)
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            os.waitpid(pid, 0)
 
 
 if __name__ == "__main__":
     port = 8000
+    workers = None
     if len(sys.argv) > 1:
         port = int(sys.argv[1])
-    run(port)
+    if len(sys.argv) > 2:
+        workers = int(sys.argv[2])
+    run(port, workers)